@@ -1,4 +1,35 @@
-from typing import Any, Dict, List, Optional, Hashable
+import sys
+from collections import deque
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Hashable,
+    Iterable,
+    Sequence,
+)
+
+_NODE_POOL_SIZE = 1 << 16
+_NODE_POOLS: Dict[type, Deque["Node"]] = {}
+# Stored as the identifier of a released node until ``acquire`` hands it out again.
+_RELEASED = object()
+
+
+def _intern(value: Any) -> Any:
+    """
+    Interns exact ``str`` values so dict keys built from them compare by identity.
+
+    Args:
+        value: The value to intern. Non-string values are returned unchanged.
+
+    Returns:
+        The interned string, or the original value.
+    """
+    return sys.intern(value) if type(value) is str else value
 
 
 class Node:
@@ -7,8 +38,12 @@ class Node:
 
     Each node can have a tag, an identifier, and associated data.
     It also maintains relationships with its predecessors and successors within different trees.
+    The per-tree predecessor and successor dicts are created on first write, so they are None
+    on nodes that have never been linked.
     """
 
+    __slots__ = ("tag", "identifier", "expanded", "_predecessor", "_successors", "data")
+
     def __init__(self, tag: Any, identifier: Optional[Hashable] = None) -> None:
         """
         Initializes a new Node object.
@@ -18,12 +53,97 @@ class Node:
             identifier: An optional identifier for this node. Must be hashable if provided.
         """
         self.tag: Any = tag
-        self.identifier: Optional[Hashable] = identifier
+        self.identifier: Optional[Hashable] = _intern(identifier)
         self.expanded: bool = True
-        self._predecessor: Dict[str, Optional[Hashable]] = {}
-        self._successors: Dict[str, List[Hashable]] = {}
+        self._predecessor: Optional[Dict[str, Optional[Hashable]]] = None
+        self._successors: Optional[Dict[str, List[Hashable]]] = None
         self.data: Any = None
 
+    @classmethod
+    def batch_create(
+        cls, tags: Iterable[Any], identifiers: Iterable[Optional[Hashable]]
+    ) -> List["Node"]:
+        """
+        Creates one node per (tag, identifier) pair in a single pass.
+
+        Fields are assigned directly instead of going through ``__init__`` once per node.
+        Subclasses that set extra state in ``__init__`` should override this method.
+
+        Args:
+            tags: The tags of the nodes to create.
+            identifiers: The identifiers of the nodes to create, in the same order as ``tags``.
+
+        Returns:
+            A list of new nodes, each in the same state as one created with ``cls(tag, identifier)``.
+
+        Raises:
+            ValueError: If ``tags`` and ``identifiers`` have different lengths.
+        """
+        new = cls.__new__
+        nodes: List[Node] = []
+        append = nodes.append
+        for tag, identifier in zip(tags, identifiers, strict=True):
+            node = new(cls)
+            node.identifier = _intern(identifier)
+            node._successors = None
+            node._predecessor = None
+            node.expanded = True
+            node.tag = tag
+            node.data = None
+            append(node)
+        return nodes
+
+    @classmethod
+    def acquire(cls, tag: Any, identifier: Optional[Hashable] = None) -> "Node":
+        """
+        Returns a node of this class, reusing a released instance when one is pooled.
+
+        Args:
+            tag: The tag associated with this node. Can be any type.
+            identifier: An optional identifier for this node. Must be hashable if provided.
+
+        Returns:
+            A node in the same state as one freshly created with ``cls(tag, identifier)``.
+        """
+        try:
+            node = _NODE_POOLS[cls].pop()
+        except (KeyError, IndexError):
+            return cls(tag, identifier)
+        node.tag = tag
+        node.identifier = _intern(identifier)
+        return node
+
+    @classmethod
+    def clear_pool(cls) -> None:
+        """
+        Drops every released node pooled for this class.
+
+        The pool never shrinks on its own, so long-running callers can use this to
+        free nodes they no longer expect to reuse.
+        """
+        _NODE_POOLS.pop(cls, None)
+
+    def release(self) -> None:
+        """
+        Resets the node and returns it to the pool used by ``acquire``.
+
+        The caller must not use the node after releasing it. Releasing a node again is a
+        no-op, so the pool never hands out the same instance twice. Subclasses that set
+        extra state in ``__init__`` should extend this method to reset it.
+        """
+        if self.identifier is _RELEASED:
+            return
+        self.tag = None
+        self.identifier = _RELEASED
+        self.expanded = True
+        self._predecessor = None
+        self._successors = None
+        self.data = None
+        pool = _NODE_POOLS.get(type(self))
+        if pool is None:
+            pool = _NODE_POOLS[type(self)] = deque(maxlen=_NODE_POOL_SIZE)
+        pool.append(self)
+
     def __repr__(self) -> str:
         """
         Returns a string representation of the Node object.
@@ -41,9 +161,9 @@ class Node:
             identifier: The identifier of the successor node.
             tree_id: The identifier of the tree to which the successor is added (default is "default").
         """
-        if tree_id not in self._successors:
-            self._successors[tree_id] = []
-        self._successors[tree_id].append(identifier)
+        if self._successors is None:
+            self._successors = {}
+        self._successors.setdefault(_intern(tree_id), []).append(identifier)
 
     def set_successors(
         self, identifiers: List[Hashable], tree_id: str = "default"
@@ -55,20 +175,28 @@ class Node:
             identifiers: A list of identifiers representing the successor nodes.
             tree_id: The identifier of the tree to which the successors are set (default is "default").
         """
-        self._successors[tree_id] = identifiers
+        if self._successors is None:
+            self._successors = {}
+        self._successors[_intern(tree_id)] = identifiers
 
-    def successors(self, tree_id: str = "default") -> List[Hashable]:
+    def successors(self, tree_id: str = "default") -> Sequence[Hashable]:
         """
         Retrieves the successors of the node within a specified tree.
 
+        The result must be treated as read-only; use ``update_successors`` or ``set_successors``
+        to change it.
+
         Args:
             tree_id: The identifier of the tree for which successors are requested (default is "default").
 
         Returns:
-            A list of identifiers representing the successor nodes. Returns an empty list if no successors exist
-            for the given tree_id.
+            A list of identifiers representing the successor nodes. Returns an empty tuple if no successors
+            exist for the given tree_id.
         """
-        return self._successors.get(tree_id, [])
+        successors = self._successors
+        if successors is None:
+            return ()
+        return successors.get(tree_id, ())
 
     def set_predecessor(
         self, identifier: Optional[Hashable], tree_id: str = "default"
@@ -80,7 +208,9 @@ class Node:
             identifier: The identifier of the predecessor node. If None, it means there is no predecessor.
             tree_id: The identifier of the tree to which the predecessor is set (default is "default").
         """
-        self._predecessor[tree_id] = identifier
+        if self._predecessor is None:
+            self._predecessor = {}
+        self._predecessor[_intern(tree_id)] = identifier
 
     def predecessor(self, tree_id: str = "default") -> Optional[Hashable]:
         """
@@ -92,7 +222,10 @@ class Node:
         Returns:
             The identifier of the predecessor node, or None if no predecessor exists for the given tree_id.
         """
-        return self._predecessor.get(tree_id)
+        predecessor = self._predecessor
+        if predecessor is None:
+            return None
+        return predecessor.get(tree_id)
 
     def is_leaf(self, tree_id: str = "default") -> bool:
         """
@@ -106,4 +239,33 @@ class Node:
         Returns:
             True if the node is a leaf in the specified tree, False otherwise.
         """
-        return not bool(self._successors.get(tree_id, []))
+        successors = self._successors
+        return successors is None or not successors.get(tree_id)
+
+    def walk(
+        self, node_lookup: Callable[[Hashable], "Node"], tree_id: str = "default"
+    ) -> Iterator["Node"]:
+        """
+        Iterates over this node and its descendants in depth-first pre-order.
+
+        The walk uses an explicit stack instead of recursion, so it is not limited by the
+        interpreter's recursion depth. Successors are visited in insertion order.
+
+        Args:
+            node_lookup: A callable resolving a successor identifier to its Node, usually
+                supplied by the owning tree.
+            tree_id: The identifier of the tree to walk (default is "default").
+
+        Yields:
+            Each node of the subtree rooted at this node.
+        """
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            # Read the slot directly rather than through successors() in this hot loop.
+            successors = node._successors
+            if successors is not None:
+                successors = successors.get(tree_id)
+                if successors:
+                    stack.extend(node_lookup(nid) for nid in reversed(successors))
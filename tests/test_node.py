@@ -1,6 +1,8 @@
+import sys
+
 import pytest
 
-from tree_is_up.node import Node
+from tree_is_up.node import _NODE_POOLS, Node
 
 
 @pytest.fixture
@@ -13,12 +15,19 @@ def node2():
     return Node("Test One", "identifier 1")
 
 
+@pytest.fixture
+def empty_pools():
+    _NODE_POOLS.clear()
+    yield
+    _NODE_POOLS.clear()
+
+
 def test_initialization(node1):
     assert node1.tag == "Test One"
     assert node1.identifier == "identifier 1"
     assert node1.expanded is True
-    assert node1._predecessor == {}
-    assert node1._successors == {}
+    assert node1._predecessor is None
+    assert node1._successors is None
     assert node1.data is None
 
 
@@ -54,6 +63,20 @@ def test_set_predecessor(node2):
     assert node2.predecessor("tree 1") is None
 
 
+def test_interned_keys():
+    node = Node("Test", "".join(["identifier", " 3"]))
+    assert node.identifier is sys.intern("identifier 3")
+    node.set_predecessor("identifier 1", "".join(["tree", " 2"]))
+    assert next(iter(node._predecessor)) is sys.intern("tree 2")
+
+
+def test_unlinked_node():
+    node = Node("Test", "identifier 3")
+    assert node.successors("tree 1") == ()
+    assert node.predecessor("tree 1") is None
+    assert node.is_leaf("tree 1") is True
+
+
 def test_set_is_leaf(node1, node2):
     node1.update_successors("identifier 2", tree_id="tree 1")
     node2.set_predecessor("identifier 1", "tree 1")
@@ -61,6 +84,83 @@ def test_set_is_leaf(node1, node2):
     assert node2.is_leaf("tree 1") is True
 
 
+def test_batch_create():
+    nodes = Node.batch_create(
+        ["Test One", "Test Two"], ["identifier 1", "identifier 2"]
+    )
+    assert [n.tag for n in nodes] == ["Test One", "Test Two"]
+    assert [n.identifier for n in nodes] == ["identifier 1", "identifier 2"]
+    for node in nodes:
+        assert node.expanded is True
+        assert node._predecessor is None
+        assert node._successors is None
+        assert node.data is None
+    with pytest.raises(ValueError):
+        Node.batch_create(["Test One"], [])
+
+
+def test_acquire_reuses_released_node(empty_pools, node1):
+    node1.update_successors("identifier 2", tree_id="tree 1")
+    node1.set_predecessor("identifier 0", "tree 1")
+    node1.data = "payload"
+    node1.release()
+
+    node = Node.acquire("Test Two", "identifier 2")
+    assert node is node1
+    assert node.tag == "Test Two"
+    assert node.identifier == "identifier 2"
+    assert node.expanded is True
+    assert node._predecessor is None
+    assert node._successors is None
+    assert node.data is None
+
+
+def test_release_twice_pools_node_once(empty_pools):
+    node = Node("Test", "identifier 1")
+    node.release()
+    node.release()
+    first = Node.acquire("Test One", "identifier 1")
+    second = Node.acquire("Test Two", "identifier 2")
+    assert first is node
+    assert second is not first
+    assert first.tag == "Test One"
+
+
+def test_release_untagged_node(empty_pools):
+    node = Node(None)
+    node.update_successors("identifier 2", tree_id="tree 1")
+    node.data = {"key": "value"}
+    node.release()
+    assert node._successors is None
+    assert node.data is None
+    assert Node.acquire(None) is node
+
+
+def test_acquire_keeps_pools_per_class(empty_pools):
+    class SubNode(Node):
+        __slots__ = ()
+
+    Node("Test", "identifier 1").release()
+    node = SubNode.acquire("Sub", "identifier 2")
+    assert type(node) is SubNode
+
+
+def test_clear_pool(empty_pools):
+    node = Node("Test", "identifier 1")
+    node.release()
+    Node.clear_pool()
+    assert Node.acquire("Test", "identifier 1") is not node
+
+
+def test_walk():
+    nodes = {nid: Node(nid.upper(), nid) for nid in ("a", "b", "c", "d")}
+    nodes["a"].set_successors(["b", "d"], tree_id="tree 1")
+    nodes["b"].update_successors("c", tree_id="tree 1")
+    walked = [n.identifier for n in nodes["a"].walk(nodes.__getitem__, "tree 1")]
+    assert walked == ["a", "b", "c", "d"]
+    assert [n.identifier for n in nodes["a"].walk(nodes.__getitem__)] == ["a"]
+
+
 def test_data(node1):
     class Flower:
         def __init__(self, color):
@@ -1,10 +1,24 @@
+import types
+
 import pytest
 from tree_is_up.tree import Tree, NodeIDAbsentError, LoopError
 from tree_is_up.node import Node
 
+INPUT_MAP = types.MappingProxyType(
+    {
+        "Bill": "Harry",
+        "Jane": "Harry",
+        "Harry": None,
+        "Diane": "Jane",
+        "Mark": "Jane",
+        "Mary": "Harry",
+    }
+)
+INPUT_ROOT = next(k for k, v in INPUT_MAP.items() if v is None)
+
 
-@pytest.fixture
-def tree():
+@pytest.fixture(scope="module")
+def _tree_prototype():
     t = Tree(identifier="tree 1")
     t.create_node("Harry", "harry")
     t.create_node("Jane", "jane", parent="harry")
@@ -15,19 +29,18 @@ def tree():
 
 
 @pytest.fixture
-def input_dict():
-    return {
-        "Bill": "Harry",
-        "Jane": "Harry",
-        "Harry": None,
-        "Diane": "Jane",
-        "Mark": "Jane",
-        "Mary": "Harry",
-    }
+def tree(_tree_prototype):
+    return Tree(_tree_prototype, deep=True, identifier=_tree_prototype.identifier)
 
 
 @pytest.fixture
-def t1():
+def tree_ro(_tree_prototype):
+    # Shared across the module: tests using it must not mutate the tree or its nodes.
+    return _tree_prototype
+
+
+@pytest.fixture(scope="module")
+def _t1_prototype():
     t = Tree(identifier="t1")
     t.create_node(tag="root", identifier="r")
     t.create_node(tag="A", identifier="a", parent="r")
@@ -36,8 +49,8 @@ def t1():
     return t
 
 
-@pytest.fixture
-def t2():
+@pytest.fixture(scope="module")
+def _t2_prototype():
     t = Tree(identifier="t2")
     t.create_node(tag="root2", identifier="r2")
     t.create_node(tag="C", identifier="c", parent="r2")
@@ -46,15 +59,35 @@ def t2():
     return t
 
 
-def test_tree(tree):
-    assert isinstance(tree, Tree)
-    copy_tree = Tree(tree, deep=True)
+@pytest.fixture
+def t1(_t1_prototype):
+    return Tree(_t1_prototype, deep=True, identifier=_t1_prototype.identifier)
+
+
+@pytest.fixture
+def t2(_t2_prototype):
+    return Tree(_t2_prototype, deep=True, identifier=_t2_prototype.identifier)
+
+
+@pytest.fixture
+def empty_t1():
+    return Tree(identifier="t1")
+
+
+@pytest.fixture
+def empty_t2():
+    return Tree(identifier="t2")
+
+
+def test_tree(tree_ro):
+    assert isinstance(tree_ro, Tree)
+    copy_tree = Tree(tree_ro, deep=True)
     assert isinstance(copy_tree, Tree)
 
 
-def test_is_root(tree):
-    assert tree._nodes["harry"].is_root()
-    assert not tree._nodes["jane"].is_root()
+def test_is_root(tree_ro):
+    assert tree_ro._nodes["harry"].is_root()
+    assert not tree_ro._nodes["jane"].is_root()
 
 
 def test_tree_wise_is_root(tree):
@@ -65,8 +98,8 @@ def test_tree_wise_is_root(tree):
     assert subtree._nodes["jane"].is_root("subtree 2")
 
 
-def test_paths_to_leaves(tree):
-    paths = tree.paths_to_leaves()
+def test_paths_to_leaves(tree_ro):
+    paths = tree_ro.paths_to_leaves()
     assert len(paths) == 2
     assert ["harry", "jane", "diane"] in paths
     assert ["harry", "bill", "george"] in paths
@@ -84,54 +117,52 @@ def test_nodes(tree):
     assert tree.contains("alien")
 
 
-def test_getitem(tree):
-    for node_id in tree.nodes:
+def test_getitem(tree_ro):
+    for node_id in tree_ro.nodes:
         try:
-            tree[node_id]
+            tree_ro[node_id]
         except NodeIDAbsentError:
             pytest.fail("Node acces should be possible via getitem.")
-        try:
-            tree["root"]
-        except NodeIDAbsentError:
-            pass
-        else:
-            pytest.fail("There should be no default fallback value for getitem")
+    assert "root" not in tree_ro
+
+
+def test_getitem_absent(tree_ro):
+    # There should be no default fallback value for getitem
+    with pytest.raises(NodeIDAbsentError):
+        tree_ro["root"]
 
 
-def test_parent(tree):
-    for nid in tree.nodes:
-        if nid == tree.root:
-            assert tree.parent(nid) is None
+def test_parent(tree_ro):
+    all_nodes = set(tree_ro.all_nodes())
+    for nid in tree_ro.nodes:
+        if nid == tree_ro.root:
+            assert tree_ro.parent(nid) is None
         else:
-            assert tree.parent(nid) in tree.all_nodes()
+            assert tree_ro.parent(nid) in all_nodes
 
 
-def test_ancestor(tree):
-    for nid in tree.nodes:
-        if nid == tree.root:
-            assert tree.ancestor(nid) is None
+def test_ancestor(tree_ro):
+    all_nodes = set(tree_ro.all_nodes())
+    for nid in tree_ro.nodes:
+        if nid == tree_ro.root:
+            assert tree_ro.ancestor(nid) is None
         else:
-            for level in range(tree.level(nid) - 1, 0, -1):
-                assert tree.ancestor(nid, level=level) in tree.all_nodes()
+            for level in range(tree_ro.level(nid) - 1, 0, -1):
+                assert tree_ro.ancestor(nid, level=level) in all_nodes
 
 
-def test_children(tree):
-    for nid in tree.nodes:
-        children = tree.is_branch(nid)
+def test_children(tree_ro):
+    all_nodes = set(tree_ro.all_nodes())
+    for nid in tree_ro.nodes:
+        children = tree_ro.is_branch(nid)
         for child in children:
-            assert tree[child] in tree.all_nodes()
-        children = tree.children(nid)
+            assert tree_ro[child] in all_nodes
+        children = tree_ro.children(nid)
         for child in children:
-            assert child in tree.all_nodes()
+            assert child in all_nodes
 
-    tree.create_node("Alien", "alien", parent="jane")
-    tree.remove_node("alien")
-    try:
-        tree.is_branch("alien")
-    except NodeIDAbsentError:
-        pass
-    else:
-        pytest.fail("The absent node should be declaimed")
+    with pytest.raises(NodeIDAbsentError):
+        tree_ro.is_branch("never_existed")
 
 
 def test_remove_node(tree):
@@ -142,7 +173,7 @@ def test_remove_node(tree):
     assert tree.get_node("mark") is None
 
 
-def test_tree_wise_depth(tree):
+def test_tree_wise_depth_incremental(tree):
     assert tree.depth() == 2
     tree.create_node("Jill", "jill", parent="george")
     assert tree.depth() == 3
@@ -151,32 +182,32 @@ def test_tree_wise_depth(tree):
 
     assert tree.depth(tree.get_node("mark")) == 4
     assert tree.depth(tree.get_node("jill")) == 3
-    assert tree.depth(tree.get_node("george")) == 2
-    assert tree.depth("jane") == 1
-    assert tree.depth("bill") == 1
-    assert tree.depth("harry") == 0
 
     node = Node("Test One", "identifier 1")
     with pytest.raises(NodeIDAbsentError):
         tree.depth(node)
 
 
-def test_leaves(tree):
-    leaves = tree.leaves()
-    for nid in tree.expand_tree():
-        assert tree[nid].is_leaf() == (tree[nid] in leaves)
-    leaves = tree.leaves(nid="jane")
-    for nid in tree.expand_tree(nid="jane"):
-        assert tree[nid].is_leaf() == (tree[nid] in leaves)
+@pytest.mark.parametrize(
+    "nid,expected", [("george", 2), ("jane", 1), ("bill", 1), ("harry", 0)]
+)
+def test_tree_wise_depth(tree_ro, nid, expected):
+    assert tree_ro.depth(nid) == expected
+    assert tree_ro.depth(tree_ro.get_node(nid)) == expected
+
 
+def test_leaves(tree_ro):
+    for nid in (None, "jane"):
+        leaf_ids = {n.identifier for n in tree_ro.leaves(nid=nid)}
+        all_ids = list(tree_ro.expand_tree(nid=nid))
+        assert {i for i in all_ids if tree_ro[i].is_leaf()} == leaf_ids
 
-def test_tree_wise_leaves(tree):
-    leaves = tree.leaves()
-    for nid in tree.expand_tree():
-        assert tree[nid].is_leaf("tree 1") == (tree[nid] in leaves)
-    leaves = tree.leaves(nid="jane")
-    for nid in tree.expand_tree(nid="jane"):
-        assert tree[nid].is_leaf("tree 1") == (tree[nid] in leaves)
+
+def test_tree_wise_leaves(tree_ro):
+    for nid in (None, "jane"):
+        leaf_ids = {n.identifier for n in tree_ro.leaves(nid=nid)}
+        all_ids = list(tree_ro.expand_tree(nid=nid))
+        assert {i for i in all_ids if tree_ro[i].is_leaf("tree 1")} == leaf_ids
 
 
 def test_link_past_node(tree):
@@ -187,39 +218,30 @@ def test_link_past_node(tree):
     assert "mark" in tree.is_branch("harry")
 
 
-def test_expand_tree(tree):
-    # Traverse in depth first mode preserving insertion order
-    nodes = [nid for nid in tree.expand_tree(sorting=False)]
-    assert nodes == ["harry", "jane", "diane", "bill", "george"]
-    assert len(nodes) == 5
-
-    # By default traverse depth first and sort child nodes by node tag
-    nodes = [nid for nid in tree.expand_tree()]
-    assert nodes == ["harry", "bill", "george", "jane", "diane"]
-    assert len(nodes) == 5
-
-    # expanding from specific node
-    nodes = [nid for nid in tree.expand_tree(nid="bill")]
-    assert nodes == ["bill", "george"]
-    assert len(nodes) == 2
-
-    # changing into width mode preserving insertion order
-    nodes = [nid for nid in tree.expand_tree(mode=Tree.WIDTH, sorting=False)]
-    assert nodes == ["harry", "jane", "bill", "diane", "george"]
-    assert len(nodes) == 5
-
-    # Breadth first mode, child nodes sorting by tag
-    nodes = [nid for nid in tree.expand_tree(mode=Tree.WIDTH)]
-    assert nodes == ["harry", "bill", "jane", "george", "diane"]
-    assert len(nodes) == 5
-
-    # expanding by filters
-    # Stops at root
-    nodes = [nid for nid in tree.expand_tree(filter=lambda x: x.tag == "Bill")]
-    assert len(nodes) == 0
-    nodes = [nid for nid in tree.expand_tree(filter=lambda x: x.tag != "Bill")]
-    assert nodes == ["harry", "jane", "diane"]
-    assert len(nodes) == 3
+@pytest.mark.parametrize(
+    "kwargs,expected",
+    [
+        # Traverse in depth first mode preserving insertion order
+        ({"sorting": False}, ["harry", "jane", "diane", "bill", "george"]),
+        # By default traverse depth first and sort child nodes by node tag
+        ({}, ["harry", "bill", "george", "jane", "diane"]),
+        # expanding from specific node
+        ({"nid": "bill"}, ["bill", "george"]),
+        # changing into width mode preserving insertion order
+        (
+            {"mode": Tree.WIDTH, "sorting": False},
+            ["harry", "jane", "bill", "diane", "george"],
+        ),
+        # Breadth first mode, child nodes sorting by tag
+        ({"mode": Tree.WIDTH}, ["harry", "bill", "jane", "george", "diane"]),
+        # expanding by filters
+        # Stops at root
+        ({"filter": lambda x: x.tag == "Bill"}, []),
+        ({"filter": lambda x: x.tag != "Bill"}, ["harry", "jane", "diane"]),
+    ],
+)
+def test_expand_tree(tree_ro, kwargs, expected):
+    assert list(tree_ro.expand_tree(**kwargs)) == expected
 
 
 def test_move_node(tree):
@@ -238,90 +260,83 @@ def test_paste_tree(tree):
     assert "mark" not in tree.nodes.keys()
 
 
-def test_merge_on_empty(t2):
-    # merge on empty initial tree
-    t = Tree(identifier="t1")
-    t.merge(nid=None, new_tree=t2)
-
-    assert t.identifier == "t1"
-    assert t.root == "r2"
-    assert set(t._nodes.keys()) == {"r2", "c", "d", "d1"}
-
-
-def test_merge_on_new_empty(t1):
-    # merge empty new_tree (on root)
-    t = Tree(identifier="t2")
-    t1.merge(nid="r", new_tree=t)
-
-    assert t1.identifier == "t1"
-    assert t1.root == "r"
-    assert set(t1._nodes.keys()) == {"r", "a", "a1", "b"}
-
-
-def test_merge_at_root(t1, t2):
-    # merge at root
-    t1.merge(nid="r", new_tree=t2)
-
-    assert t1.identifier == "t1"
-    assert t1.root == "r"
-    assert "r2" not in t1._nodes.keys()
-    assert set(t1._nodes.keys()) == {"r", "a", "a1", "b", "c", "d", "d1"}
-
-
-def test_merge_on_node(t1, t2):
-    # merge on node
-    t1.merge(nid="b", new_tree=t2)
-    assert t1.identifier == "t1"
-    assert t1.root == "r"
-    assert "r2" not in t1._nodes.keys()
-    assert set(t1._nodes.keys()) == {"r", "a", "a1", "b", "c", "d", "d1"}
-
-
-def test_paste_under_root(t1, t2):
-    # paste under root
-    t1.paste(nid="r", new_tree=t2)
-    assert t1.identifier == "t1"
-    assert t1.root == "r"
-    assert t1.parent("r2").identifier == "r"
-    assert set(t1._nodes.keys()) == {"r", "r2", "a", "a1", "b", "c", "d", "d1"}
+@pytest.mark.parametrize(
+    "op,nid,dst_fixture,src_fixture,expected_root,expected_nodes,expected_r2_parent",
+    [
+        # merge on empty initial tree
+        ("merge", None, "empty_t1", "t2", "r2", {"r2", "c", "d", "d1"}, None),
+        # merge empty new_tree (on root)
+        ("merge", "r", "t1", "empty_t2", "r", {"r", "a", "a1", "b"}, None),
+        # merge at root
+        ("merge", "r", "t1", "t2", "r", {"r", "a", "a1", "b", "c", "d", "d1"}, None),
+        # merge on node
+        ("merge", "b", "t1", "t2", "r", {"r", "a", "a1", "b", "c", "d", "d1"}, None),
+        # paste under root
+        (
+            "paste",
+            "r",
+            "t1",
+            "t2",
+            "r",
+            {"r", "r2", "a", "a1", "b", "c", "d", "d1"},
+            "r",
+        ),
+        # paste under node
+        (
+            "paste",
+            "b",
+            "t1",
+            "t2",
+            "r",
+            {"r", "a", "a1", "b", "c", "d", "d1", "r2"},
+            "b",
+        ),
+        # paste empty new_tree (under root)
+        ("paste", "r", "t1", "empty_t2", "r", {"r", "a", "a1", "b"}, None),
+    ],
+)
+def test_merge_and_paste(
+    request,
+    op,
+    nid,
+    dst_fixture,
+    src_fixture,
+    expected_root,
+    expected_nodes,
+    expected_r2_parent,
+):
+    dst = request.getfixturevalue(dst_fixture)
+    src = request.getfixturevalue(src_fixture)
+    getattr(dst, op)(nid=nid, new_tree=src)
+
+    assert dst.identifier == "t1"
+    assert dst.root == expected_root
+    assert dst._nodes.keys() == expected_nodes
+    # expected_r2_parent is None when "r2" is absent or is the root of dst.
+    r2_parent = dst.parent("r2") if "r2" in dst else None
+    assert (r2_parent.identifier if r2_parent else None) == expected_r2_parent
 
 
 def test_paste_under_non_existing_node(t1, t2):
     # paste under non-existing node
-    with pytest.raises(NodeIDAbsentError) as e:
+    with pytest.raises(
+        NodeIDAbsentError, match=r"^Node 'not_existing' is not in the tree$"
+    ):
         t1.paste(nid="not_existing", new_tree=t2)
-    assert e.exception.args[0] == "Node 'not_existing' is not in the tree"
 
 
 def test_paste_under_none_nid(t1, t2):
     # paste under None nid
-    with pytest.raises(ValueError) as e:
+    with pytest.raises(
+        ValueError, match=r'^Must define "nid" under which new tree is pasted\.$'
+    ):
         t1.paste(nid=None, new_tree=t2)
-    assert e.exception.args[0] == 'Must define "nid" under which new tree is pasted.'
-
-
-def test_paste_under_node(t1, t2):
-    # paste under node
-    t1.paste(nid="b", new_tree=t2)
-    assert t1.identifier == "t1"
-    assert t1.root == "r"
-    assert t1.parent("b").identifier == "r"
-    assert set(t1._nodes.keys()) == {"r", "a", "a1", "b", "c", "d", "d1", "r2"}
-
-
-def test_paste_empty_new_tree_under_root(t1):
-    # paste empty new_tree (under root)
-    t2 = Tree(identifier="t2")
-    t1.paste(nid="r", new_tree=t2)
 
-    assert t1.identifier == "t1"
-    assert t1.root == "r"
-    assert set(t1._nodes.keys()) == {"r", "a", "a1", "b"}
 
-
-def test_rsearch(tree):
+def test_rsearch(tree_ro):
+    ancestors = set(tree_ro.rsearch("diane"))
     for nid in ["harry", "jane", "diane"]:
-        assert nid in tree.rsearch("diane")
+        assert nid in ancestors
 
 
 def test_subtree(tree):
@@ -345,14 +360,14 @@ def test_remove_subtree_whole_tree(tree):
     assert len(tree.nodes.keys()) == 0
 
 
-def test_to_json(tree):
-    tree.to_json()
-    tree.to_json(True)
+def test_to_json(tree_ro):
+    tree_ro.to_json()
+    tree_ro.to_json(True)
 
 
-def test_siblings(tree):
-    assert len(tree.siblings("harry")) == 0
-    assert tree.siblings("jane")[0].identifier == "bill"
+def test_siblings(tree_ro):
+    assert len(tree_ro.siblings("harry")) == 0
+    assert tree_ro.siblings("jane")[0].identifier == "bill"
 
 
 def test_tree_data(tree):
@@ -364,17 +379,17 @@ def test_tree_data(tree):
     assert tree["jill"].data.color == "white"
 
 
-def test_level(tree):
-    assert tree.level("harry") == 0
-    depth = tree.depth()
-    assert tree.level("diane") == depth
-    assert tree.level("diane", lambda x: x.identifier != "jane") == depth - 1
+def test_level(tree_ro):
+    assert tree_ro.level("harry") == 0
+    depth = tree_ro.depth()
+    assert tree_ro.level("diane") == depth
+    assert tree_ro.level("diane", lambda x: x.identifier != "jane") == depth - 1
 
 
-def test_size(tree):
-    assert tree.size(level=2) == 2
-    assert tree.size(level=1) == 2
-    assert tree.size(level=0) == 1
+def test_size(tree_ro):
+    assert tree_ro.size(level=2) == 2
+    assert tree_ro.size(level=1) == 2
+    assert tree_ro.size(level=0) == 1
 
 
 def test_all_nodes_itr():
@@ -418,10 +433,8 @@ def test_loop():
     tree.create_node("b", "b", parent="a")
     tree.create_node("c", "c", parent="b")
     tree.create_node("d", "d", parent="c")
-    try:
+    with pytest.raises(LoopError):
         tree.move_node("b", "d")
-    except LoopError:
-        pass
 
 
 def test_modify_node_identifier_directly_failed():
@@ -508,9 +521,8 @@ def test_paste_duplicate_nodes():
     t2.create_node(identifier="A")
     t2.create_node(identifier="B", parent="A")
 
-    with pytest.raises(ValueError) as e:
+    with pytest.raises(ValueError, match=r"^Duplicated nodes \['A'\] exists\.$"):
         t1.paste("A", t2)
-    assert e.exception.args == ("Duplicated nodes ['A'] exists.",)
 
 
 def test_shallow_paste():
@@ -546,25 +558,40 @@ def test_root_removal():
     assert t.root == "root-B"
 
 
-def test_from_map(input_dict):
-    tree = Tree.from_map(input_dict)
-    assert tree.size() == 6
-    assert tree.root == [k for k, v in input_dict.items() if v is None][0]
-    tree = Tree.from_map(input_dict, id_func=lambda x: x.upper())
+def _upper(x):
+    return x.upper()
+
+
+@pytest.mark.parametrize(
+    "kwargs,expected_root,expected_root_data,expected_nodes",
+    [
+        ({}, INPUT_ROOT, None, set(INPUT_MAP)),
+        (
+            {"id_func": _upper},
+            _upper(INPUT_ROOT),
+            None,
+            {_upper(k) for k in INPUT_MAP},
+        ),
+        ({"data_func": _upper}, INPUT_ROOT, _upper(INPUT_ROOT), set(INPUT_MAP)),
+    ],
+)
+def test_from_map(kwargs, expected_root, expected_root_data, expected_nodes):
+    tree = Tree.from_map(INPUT_MAP, **kwargs)
     assert tree.size() == 6
+    assert tree.root == expected_root
+    assert tree.get_node(tree.root).data == expected_root_data
+    assert tree.nodes.keys() == expected_nodes
 
-    def data_func(x):
-        return x.upper()
 
-    tree = Tree.from_map(input_dict, data_func=data_func)
-    assert tree.size() == 6
-    assert tree.get_node(tree.root).data == data_func(
-        [k for k, v in input_dict.items() if v is None][0]
-    )
-    with pytest.raises(ValueError):
+@pytest.mark.parametrize(
+    "child_parent",
+    [
         # invalid input payload without a root
-        tree = Tree.from_map({"a": "b"})
-
-    with pytest.raises(ValueError):
+        {"a": "b"},
         # invalid input payload without more than 1 root
-        tree = Tree.from_map({"a": None, "b": None})
+        {"a": None, "b": None},
+    ],
+)
+def test_from_map_invalid(child_parent):
+    with pytest.raises(ValueError):
+        Tree.from_map(child_parent)